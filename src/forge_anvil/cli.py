@@ -13,29 +13,43 @@ warnings.filterwarnings(
 )
 
 import asyncio  # noqa: E402
-import json  # noqa: E402
-from typing import Annotated  # noqa: E402
+from functools import lru_cache  # noqa: E402
+from typing import TYPE_CHECKING, Annotated, Any  # noqa: E402
 
 import typer  # noqa: E402
 
+from forge_anvil import _json  # noqa: E402
 from forge_anvil.client import AnvilClient, AnvilError  # noqa: E402
 from forge_anvil.output import (  # noqa: E402
+    add_tool_row,
     console,
+    new_tools_table,
     print_error,
     print_info,
+    print_json,
     print_prompts,
     print_resources,
     print_result,
     print_tool_detail,
-    print_tools,
+    print_tools_table,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - depends on installed extras
+    uvloop = None
+
 app = typer.Typer(
     name="anvil",
     help="MCP client tool for testing MCP servers.",
     no_args_is_help=True,
 )
 
+DEFAULT_SERVER = "http://localhost:8000/mcp"
+
 # Global options
 ServerOption = Annotated[
     str,
@@ -69,6 +83,9 @@ JsonOption = Annotated[
 def parse_headers(headers: list[str] | None) -> dict[str, str]:
     """Parse header strings into a dictionary.
 
+    Parsing is memoized on the header values, so repeated calls with the
+    same headers only build a fresh dict.
+
     Args:
         headers: List of headers in 'Key: Value' format
 
@@ -80,47 +97,108 @@ def parse_headers(headers: list[str] | None) -> dict[str, str]:
     """
     if not headers:
         return {}
-    result = {}
+    return dict(_parse_header_items(tuple(headers)))
+
+
+@lru_cache(maxsize=64)
+def _parse_header_items(headers: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Split 'Key: Value' header strings into (key, value) pairs."""
+    items = []
     for h in headers:
-        if ": " not in h:
+        idx = h.find(": ")
+        if idx == -1:
             raise typer.BadParameter(f"Invalid header format: '{h}'. Use 'Key: Value' format.")
-        key, value = h.split(": ", 1)
-        result[key] = value
+        items.append((h[:idx], h[idx + 2 :]))
+    return tuple(items)
+
+
+def parse_arg_values(values: list[str]) -> list[Any]:
+    """Parse --arg values as JSON where possible, keeping the rest as strings.
+
+    When no value contains a comma, all of them are parsed in one go as a
+    JSON array: the joining commas are then the only ones, so each element
+    must be exactly one value. Otherwise, or if that parse fails, values are
+    parsed one at a time.
+
+    Args:
+        values: Raw values from key=value arguments
+
+    Returns:
+        Parsed values, in the same order
+    """
+    if all(_json.looks_like_json(v) and "," not in v for v in values):
+        try:
+            parsed = _json.loads_exact("[" + ",".join(values) + "]")
+        except ValueError:
+            pass
+        else:
+            if len(parsed) == len(values):
+                return parsed
+
+    result: list[Any] = []
+    for value in values:
+        # Try to parse value as JSON for complex types
+        try:
+            result.append(_json.loads_exact(value) if _json.looks_like_json(value) else value)
+        except ValueError:
+            result.append(value)
     return result
 
 
-def run_async(coro: object) -> None:
-    """Helper to run async coroutines from sync Typer commands."""
-    asyncio.run(coro)  # type: ignore[arg-type]
+def run_async(coro: Coroutine[Any, Any, None]) -> None:
+    """Helper to run async coroutines from sync Typer commands.
+
+    Each command runs a single coroutine and then exits, so this drives a bare
+    event loop (uvloop when installed) instead of asyncio.run(), skipping its
+    signal handler setup, task cancellation and default executor shutdown.
+    """
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(coro)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
+def make_client(server: str, header: list[str] | None) -> AnvilClient:
+    """Create a client from the --server and --header options shared by all commands."""
+    return AnvilClient(server, headers=parse_headers(header))
+
+
+def run_command(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a command coroutine, reporting AnvilErrors and exiting with status 1."""
+    try:
+        run_async(coro)
+    except AnvilError as e:
+        print_error(str(e))
+        raise typer.Exit(1) from e
 
 
 @app.command()
 def info(
-    server: ServerOption = "http://localhost:8000/mcp",
+    server: ServerOption = DEFAULT_SERVER,
     header: HeaderOption = None,
     json_output: JsonOption = False,
 ) -> None:
     """Show server info and capabilities."""
 
+    client = make_client(server, header)
+
     async def _info() -> None:
-        headers = parse_headers(header)
-        client = AnvilClient(server, headers=headers)
         result = await client.get_server_info()
         if json_output:
-            console.print_json(data=result)
+            print_json(result)
         else:
             print_info(result)
 
-    try:
-        run_async(_info())
-    except AnvilError as e:
-        print_error(str(e))
-        raise typer.Exit(1) from e
+    run_command(_info())
 
 
 @app.command("list-tools")
 def list_tools(
-    server: ServerOption = "http://localhost:8000/mcp",
+    server: ServerOption = DEFAULT_SERVER,
     header: HeaderOption = None,
     json_output: JsonOption = False,
     detail: Annotated[
@@ -134,38 +212,36 @@ def list_tools(
 ) -> None:
     """List available tools from the server."""
 
-    async def _list() -> None:
-        headers = parse_headers(header)
-        client = AnvilClient(server, headers=headers)
-        tools = await client.list_tools()
+    client = make_client(server, header)
 
+    async def _list() -> None:
         if detail:
             # Find the specific tool
-            tool = next((t for t in tools if t["name"] == detail), None)
+            tool = await anext((t async for t in client.iter_tools() if t["name"] == detail), None)
             if tool:
                 if json_output:
-                    console.print_json(data=tool)
+                    print_json(tool)
                 else:
                     print_tool_detail(tool)
             else:
                 print_error(f"Tool '{detail}' not found")
                 raise typer.Exit(1)
         elif json_output:
-            console.print_json(data=tools)
+            print_json(await client.list_tools())
         else:
-            print_tools(tools)
+            # Fill the table as tools arrive rather than building a list first
+            table = new_tools_table()
+            async for tool in client.iter_tools():
+                add_tool_row(table, tool)
+            print_tools_table(table)
 
-    try:
-        run_async(_list())
-    except AnvilError as e:
-        print_error(str(e))
-        raise typer.Exit(1) from e
+    run_command(_list())
 
 
 @app.command()
 def call(
     tool: Annotated[str, typer.Argument(help="Tool name to call")],
-    server: ServerOption = "http://localhost:8000/mcp",
+    server: ServerOption = DEFAULT_SERVER,
     header: HeaderOption = None,
     arg: Annotated[
         list[str] | None,
@@ -193,103 +269,91 @@ def call(
     2. JSON string: anvil call get_weather --json-args '{"city": "Berlin"}'
     """
 
+    client = make_client(server, header)
+
     async def _call() -> None:
         # Parse arguments
         arguments: dict = {}
 
         if json_args:
             try:
-                arguments = json.loads(json_args)
-            except json.JSONDecodeError as e:
+                arguments = _json.loads_exact(json_args)
+            except ValueError as e:
                 print_error(f"Invalid JSON: {e}")
                 raise typer.Exit(1) from e
         elif arg:
+            keys: list[str] = []
+            values: list[str] = []
             for a in arg:
-                if "=" not in a:
+                key, sep, value = a.partition("=")
+                if not sep:
                     print_error(f"Invalid argument format: '{a}'. Use key=value format.")
                     raise typer.Exit(1)
+                keys.append(key)
+                values.append(value)
 
-                key, _, value = a.partition("=")
-                # Try to parse value as JSON for complex types
-                try:
-                    arguments[key] = json.loads(value)
-                except json.JSONDecodeError:
-                    arguments[key] = value
+            arguments = dict(zip(keys, parse_arg_values(values), strict=True))
 
-        headers = parse_headers(header)
-        client = AnvilClient(server, headers=headers)
         result = await client.call_tool(tool, arguments or None)
 
         if json_output:
-            console.print_json(data=result)
+            print_json(result)
         else:
             print_result(result)
 
-    try:
-        run_async(_call())
-    except AnvilError as e:
-        print_error(str(e))
-        raise typer.Exit(1) from e
+    run_command(_call())
 
 
 @app.command("list-resources")
 def list_resources(
-    server: ServerOption = "http://localhost:8000/mcp",
+    server: ServerOption = DEFAULT_SERVER,
     header: HeaderOption = None,
     json_output: JsonOption = False,
 ) -> None:
     """List available resources from the server."""
 
+    client = make_client(server, header)
+
     async def _list() -> None:
-        headers = parse_headers(header)
-        client = AnvilClient(server, headers=headers)
         resources = await client.list_resources()
         if json_output:
-            console.print_json(data=resources)
+            print_json(resources)
         else:
             print_resources(resources)
 
-    try:
-        run_async(_list())
-    except AnvilError as e:
-        print_error(str(e))
-        raise typer.Exit(1) from e
+    run_command(_list())
 
 
 @app.command("list-prompts")
 def list_prompts(
-    server: ServerOption = "http://localhost:8000/mcp",
+    server: ServerOption = DEFAULT_SERVER,
     header: HeaderOption = None,
     json_output: JsonOption = False,
 ) -> None:
     """List available prompts from the server."""
 
+    client = make_client(server, header)
+
     async def _list() -> None:
-        headers = parse_headers(header)
-        client = AnvilClient(server, headers=headers)
         prompts = await client.list_prompts()
         if json_output:
-            console.print_json(data=prompts)
+            print_json(prompts)
         else:
             print_prompts(prompts)
 
-    try:
-        run_async(_list())
-    except AnvilError as e:
-        print_error(str(e))
-        raise typer.Exit(1) from e
+    run_command(_list())
 
 
 @app.command()
 def ping(
-    server: ServerOption = "http://localhost:8000/mcp",
+    server: ServerOption = DEFAULT_SERVER,
     header: HeaderOption = None,
 ) -> None:
     """Check if server is responsive."""
 
+    client = make_client(server, header)
+
     async def _ping() -> None:
-        headers = parse_headers(header)
-        client = AnvilClient(server, headers=headers)
         if await client.ping():
             console.print(f"[green]Server at {server} is responsive[/green]")
         else:
@@ -301,7 +365,7 @@ def ping(
 
 @app.command()
 def ui(
-    server: ServerOption = "http://localhost:8000/mcp",
+    server: ServerOption = DEFAULT_SERVER,
     port: Annotated[
         int,
         typer.Option(
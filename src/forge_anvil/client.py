@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any
+from contextlib import asynccontextmanager
+from functools import cache
+from typing import TYPE_CHECKING, Any, Self
 
-from fastmcp import Client
-from fastmcp.client.transports import StreamableHttpTransport
+# fastmcp and mcp are imported where they are first needed: importing them
+# takes seconds, which would otherwise be paid by every `anvil --help`.
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from types import TracebackType
+
+    from fastmcp import Client
+    from fastmcp.client.transports import StreamableHttpTransport
+
+
+# Server capabilities reported by get_server_info
+_CAPABILITY_NAMES = ("tools", "resources", "prompts", "logging")
 
 
 class AnvilError(Exception):
@@ -25,34 +37,76 @@ class AnvilClient:
 
     Provides a simpler interface that returns plain dictionaries
     instead of MCP types, making it easier to serialize to JSON.
+
+    Each method opens its own connection by default. Use the client as an
+    async context manager to keep one session open across several calls::
+
+        async with AnvilClient(url) as client:
+            tools = await client.list_tools()
+            result = await client.call_tool(tools[0]["name"])
     """
 
     def __init__(
         self,
         server_url: str,
-        timeout: float = 30.0,
+        timeout: float | None = None,
         headers: dict[str, str] | None = None,
     ) -> None:
         """Initialize the client.
 
         Args:
             server_url: URL of the MCP server (e.g., http://localhost:8000/mcp)
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds, or None to wait indefinitely
             headers: Custom HTTP headers to send with requests
         """
         self.server_url = server_url
         self.timeout = timeout
         self.headers = headers or {}
+        self._client: Client | None = None
+
+    async def __aenter__(self) -> Self:
+        """Connect and keep the session open until the context exits."""
+        client = self._create_client()
+        try:
+            await client.__aenter__()
+        except Exception as e:
+            raise ConnectionError(f"Failed to connect to {self.server_url}: {e}") from e
+        self._client = client
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the session opened by __aenter__."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.__aexit__(exc_type, exc, tb)
 
     def _create_transport(self) -> StreamableHttpTransport:
         """Create transport with headers support."""
+        from fastmcp.client.transports import StreamableHttpTransport
+
         return StreamableHttpTransport(url=self.server_url, headers=self.headers)
 
     def _create_client(self) -> Client:
         """Create a Client instance with headers if specified."""
+        from fastmcp import Client
+
         if self.headers:
-            return Client(self._create_transport())
-        return Client(self.server_url)
+            return Client(self._create_transport(), timeout=self.timeout)
+        return Client(self.server_url, timeout=self.timeout)
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[Client]:
+        """Yield the open session, or a one-off connection outside a context."""
+        if self._client is not None:
+            yield self._client
+        else:
+            async with self._create_client() as client:
+                yield client
 
     async def get_server_info(self) -> dict[str, Any]:
         """Get server capabilities and info.
@@ -66,7 +120,7 @@ class AnvilClient:
             - instructions: Server instructions (if provided)
         """
         try:
-            async with self._create_client() as client:
+            async with self._session() as client:
                 # Get server info from initialize_result (set after connection)
                 init_result = client.initialize_result
 
@@ -100,20 +154,30 @@ class AnvilClient:
         Returns:
             List of tools with name, description, and input_schema.
         """
+        return [tool async for tool in self.iter_tools()]
+
+    async def iter_tools(self) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over available tools from the server.
+
+        The connection is released before the first tool is yielded, so
+        callers may stop iterating early.
+
+        Yields:
+            Tools with name, description, and input_schema.
+        """
         try:
-            async with self._create_client() as client:
+            async with self._session() as client:
                 tools = await client.list_tools()
-                return [
-                    {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "input_schema": tool.inputSchema,
-                    }
-                    for tool in tools
-                ]
         except Exception as e:
             raise ConnectionError(f"Failed to list tools: {e}") from e
 
+        for tool in tools:
+            yield {
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": tool.inputSchema,
+            }
+
     async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
         """Call a tool and return the result.
 
@@ -125,7 +189,7 @@ class AnvilClient:
             Dictionary with content and is_error flag.
         """
         try:
-            async with self._create_client() as client:
+            async with self._session() as client:
                 result = await client.call_tool(name, arguments or {})
                 return {
                     "content": _content_to_list(result),
@@ -141,7 +205,7 @@ class AnvilClient:
             List of resources with uri, name, description, and mime_type.
         """
         try:
-            async with self._create_client() as client:
+            async with self._session() as client:
                 resources = await client.list_resources()
                 return [
                     {
@@ -162,7 +226,7 @@ class AnvilClient:
             List of prompts with name, description, and arguments.
         """
         try:
-            async with self._create_client() as client:
+            async with self._session() as client:
                 prompts = await client.list_prompts()
                 return [
                     {
@@ -189,7 +253,7 @@ class AnvilClient:
             True if server responds, False otherwise.
         """
         try:
-            async with self._create_client() as client:
+            async with self._session() as client:
                 await client.ping()
                 return True
         except Exception:
@@ -197,29 +261,48 @@ class AnvilClient:
 
 
 def _capabilities_to_dict(capabilities: Any) -> dict[str, Any]:
-    """Convert server capabilities to a dictionary."""
-    if capabilities is None:
-        return {}
-
-    result: dict[str, Any] = {}
-
-    # Check for common capability attributes
-    if hasattr(capabilities, "tools") and capabilities.tools:
-        result["tools"] = True
-    if hasattr(capabilities, "resources") and capabilities.resources:
-        result["resources"] = True
-    if hasattr(capabilities, "prompts") and capabilities.prompts:
-        result["prompts"] = True
-    if hasattr(capabilities, "logging") and capabilities.logging:
-        result["logging"] = True
+    """Convert server capabilities to a dictionary of enabled flags.
 
-    return result
+    A capability counts as enabled when present, even if its settings are
+    empty (e.g. a bare ``LoggingCapability()``).
+    """
+    return {
+        name: True for name in _CAPABILITY_NAMES if getattr(capabilities, name, None) is not None
+    }
+
+
+@cache
+def _content_handlers() -> dict[type, Callable[[Any], dict[str, Any]]]:
+    """Return converters for the common content item types, keyed by exact type."""
+    from mcp.types import ImageContent, TextContent
+
+    return {
+        TextContent: lambda item: {"type": "text", "text": item.text},
+        ImageContent: lambda item: {"type": "image", "data": item.data, "mime_type": item.mimeType},
+        str: lambda item: {"type": "text", "text": item},
+        dict: lambda item: item,
+    }
+
+
+def _content_item_to_dict(item: Any) -> dict[str, Any]:
+    """Convert a content item of a type not in the handler table."""
+    if hasattr(item, "text"):
+        return {"type": "text", "text": item.text}
+    if hasattr(item, "data"):
+        return {
+            "type": "image",
+            "data": item.data,
+            "mime_type": getattr(item, "mimeType", "image/png"),
+        }
+    if isinstance(item, str):
+        return {"type": "text", "text": item}
+    if isinstance(item, dict):
+        return item
+    return {"type": "text", "text": str(item)}
 
 
 def _content_to_list(result: Any) -> list[dict[str, Any]]:
     """Convert tool result content to a list of dictionaries."""
-    content_list = []
-
     # Handle different result types
     if hasattr(result, "content"):
         items = result.content if isinstance(result.content, list) else [result.content]
@@ -228,22 +311,11 @@ def _content_to_list(result: Any) -> list[dict[str, Any]]:
     else:
         items = [result]
 
+    # One dict lookup per item for the common MCP types instead of attribute probing
+    handlers = _content_handlers()
+    content_list = []
     for item in items:
-        if hasattr(item, "text"):
-            content_list.append({"type": "text", "text": item.text})
-        elif hasattr(item, "data"):
-            content_list.append(
-                {
-                    "type": "image",
-                    "data": item.data,
-                    "mime_type": getattr(item, "mimeType", "image/png"),
-                }
-            )
-        elif isinstance(item, str):
-            content_list.append({"type": "text", "text": item})
-        elif isinstance(item, dict):
-            content_list.append(item)
-        else:
-            content_list.append({"type": "text", "text": str(item)})
+        handler = handlers.get(type(item))
+        content_list.append(handler(item) if handler else _content_item_to_dict(item))
 
     return content_list
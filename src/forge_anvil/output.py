@@ -2,16 +2,89 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.highlighter import JSONHighlighter
 from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.style import Style
 from rich.table import Table
+from rich.text import Text
+
+from forge_anvil import _json
+
+if TYPE_CHECKING:
+    from pygments.lexer import Lexer
+    from rich.console import RenderableType
+    from rich.syntax import Syntax, SyntaxTheme
 
 console = Console()
 
+_SYNTAX_THEME = "monokai"
+
+# Styles and labels are parsed once here instead of on every print call
+_HEADER_STYLE = Style.parse("bold cyan")
+_ERROR_LABEL = Text("Error:", style="bold red")
+_SUCCESS_LABEL = Text("Success:", style="bold green")
+_JSON_HIGHLIGHTER = JSONHighlighter()
+
+# Placeholder cells, shared by every row so Rich never parses their markup.
+# The style is a span rather than the base style, so the cell padding stays unstyled.
+_NO_DESCRIPTION = Text.assemble(("No description", "dim"))
+_NO_MIME_TYPE = Text.assemble(("-", "dim"))
+_NO_ARGUMENTS = Text.assemble(("None", "dim"))
+_ARGUMENT_SEPARATOR = Text(", ")
+
+# (header, style) pairs for each listing table
+_TOOL_COLUMNS: tuple[tuple[str, str | None], ...] = (
+    ("Name", "green"),
+    ("Description", None),
+)
+_RESOURCE_COLUMNS: tuple[tuple[str, str | None], ...] = (
+    ("Name", "green"),
+    ("URI", "blue"),
+    ("MIME Type", None),
+    ("Description", None),
+)
+_PROMPT_COLUMNS: tuple[tuple[str, str | None], ...] = (
+    ("Name", "green"),
+    ("Description", None),
+    ("Arguments", None),
+)
+
+
+@cache
+def _json_lexer() -> Lexer:
+    """Return the Pygments JSON lexer, looked up once per process."""
+    from pygments.lexers import get_lexer_by_name
+
+    return get_lexer_by_name("json")
+
+
+@cache
+def _syntax_theme() -> SyntaxTheme:
+    """Return the syntax theme, built once so its style cache is reused."""
+    from rich.syntax import Syntax
+
+    return Syntax.get_theme(_SYNTAX_THEME)
+
+
+def _json_syntax(code: str) -> Syntax:
+    """Build a highlighted JSON block using the cached lexer and theme."""
+    # rich.syntax and Pygments are only imported by commands that print JSON
+    from rich.syntax import Syntax
+
+    return Syntax(code, _json_lexer(), theme=_syntax_theme(), line_numbers=False)
+
+
+def _new_table(title: str, columns: tuple[tuple[str, str | None], ...]) -> Table:
+    """Create a listing table with the given columns."""
+    table = Table(title=title, show_header=True, header_style=_HEADER_STYLE)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
 
 def print_info(info: dict[str, Any]) -> None:
     """Print server info in a panel."""
@@ -35,24 +108,35 @@ def print_info(info: dict[str, Any]) -> None:
     console.print(Panel("\n".join(lines), title="Server Info", border_style="blue"))
 
 
-def print_tools(tools: list[dict[str, Any]]) -> None:
-    """Print tools in a table format."""
-    if not tools:
+def new_tools_table() -> Table:
+    """Create an empty tools table to be filled with add_tool_row."""
+    return _new_table("Available Tools", _TOOL_COLUMNS)
+
+
+def add_tool_row(table: Table, tool: dict[str, Any]) -> None:
+    """Add one tool to a table created by new_tools_table."""
+    table.add_row(
+        tool.get("name", ""),
+        tool.get("description") or _NO_DESCRIPTION,
+    )
+
+
+def print_tools_table(table: Table) -> None:
+    """Print a filled tools table with its total."""
+    if not table.row_count:
         console.print("[yellow]No tools available[/yellow]")
         return
 
-    table = Table(title="Available Tools", show_header=True, header_style="bold cyan")
-    table.add_column("Name", style="green")
-    table.add_column("Description")
+    console.print(table)
+    console.print(f"\n[dim]Total: {table.row_count} tool(s)[/dim]")
 
-    for tool in tools:
-        table.add_row(
-            tool.get("name", ""),
-            tool.get("description", "") or "[dim]No description[/dim]",
-        )
 
-    console.print(table)
-    console.print(f"\n[dim]Total: {len(tools)} tool(s)[/dim]")
+def print_tools(tools: list[dict[str, Any]]) -> None:
+    """Print tools in a table format."""
+    table = new_tools_table()
+    for tool in tools:
+        add_tool_row(table, tool)
+    print_tools_table(table)
 
 
 def print_tool_detail(tool: dict[str, Any]) -> None:
@@ -66,13 +150,7 @@ def print_tool_detail(tool: dict[str, Any]) -> None:
     schema = tool.get("input_schema", {})
     if schema:
         console.print("\n[bold]Input Schema:[/bold]")
-        syntax = Syntax(
-            json.dumps(schema, indent=2),
-            "json",
-            theme="monokai",
-            line_numbers=False,
-        )
-        console.print(syntax)
+        console.print(_json_syntax(_json.dumps(schema)))
 
 
 def print_resources(resources: list[dict[str, Any]]) -> None:
@@ -81,18 +159,14 @@ def print_resources(resources: list[dict[str, Any]]) -> None:
         console.print("[yellow]No resources available[/yellow]")
         return
 
-    table = Table(title="Available Resources", show_header=True, header_style="bold cyan")
-    table.add_column("Name", style="green")
-    table.add_column("URI", style="blue")
-    table.add_column("MIME Type")
-    table.add_column("Description")
+    table = _new_table("Available Resources", _RESOURCE_COLUMNS)
 
     for resource in resources:
         table.add_row(
             resource.get("name", ""),
             resource.get("uri", ""),
-            resource.get("mime_type", "") or "[dim]-[/dim]",
-            resource.get("description", "") or "[dim]No description[/dim]",
+            resource.get("mime_type") or _NO_MIME_TYPE,
+            resource.get("description") or _NO_DESCRIPTION,
         )
 
     console.print(table)
@@ -105,23 +179,22 @@ def print_prompts(prompts: list[dict[str, Any]]) -> None:
         console.print("[yellow]No prompts available[/yellow]")
         return
 
-    table = Table(title="Available Prompts", show_header=True, header_style="bold cyan")
-    table.add_column("Name", style="green")
-    table.add_column("Description")
-    table.add_column("Arguments")
+    table = _new_table("Available Prompts", _PROMPT_COLUMNS)
 
     for prompt in prompts:
         args = prompt.get("arguments", [])
-        args_str = (
-            ", ".join(f"[cyan]{a['name']}[/cyan]{'*' if a.get('required') else ''}" for a in args)
+        args_cell = (
+            _ARGUMENT_SEPARATOR.join(
+                Text.assemble((a["name"], "cyan"), "*" if a.get("required") else "") for a in args
+            )
             if args
-            else "[dim]None[/dim]"
+            else _NO_ARGUMENTS
         )
 
         table.add_row(
             prompt.get("name", ""),
-            prompt.get("description", "") or "[dim]No description[/dim]",
-            args_str,
+            prompt.get("description") or _NO_DESCRIPTION,
+            args_cell,
         )
 
     console.print(table)
@@ -129,47 +202,73 @@ def print_prompts(prompts: list[dict[str, Any]]) -> None:
 
 
 def print_result(result: dict[str, Any]) -> None:
-    """Print tool call result."""
+    """Print tool call result.
+
+    All content items are collected into one Group and printed with a
+    single console.print call, so layout and output happen once.
+    """
     is_error = result.get("is_error", False)
     content = result.get("content", [])
 
+    renderables: list[RenderableType] = []
     if is_error:
-        console.print("[bold red]Error:[/bold red]")
+        renderables.append(_ERROR_LABEL)
 
     for item in content:
         item_type = item.get("type", "text")
 
         if item_type == "text":
             text = item.get("text", "")
-            # Try to parse as JSON for pretty printing
-            try:
-                data = json.loads(text)
-                syntax = Syntax(
-                    json.dumps(data, indent=2),
-                    "json",
-                    theme="monokai",
-                    line_numbers=False,
-                )
-                console.print(syntax)
-            except json.JSONDecodeError:
-                if is_error:
-                    console.print(f"[red]{text}[/red]")
+            # Try to parse as JSON for pretty printing, skipping text that
+            # cannot be JSON without scanning all of it
+            if _json.looks_like_json(text):
+                try:
+                    data = _json.loads(text)
+                except ValueError:
+                    pass
                 else:
-                    console.print(text)
+                    # Multi-line JSON is already formatted by the server; only
+                    # compact payloads are worth re-serializing with indentation
+                    code = text.strip()
+                    if "\n" not in code:
+                        code = _json.dumps(data)
+                    renderables.append(_json_syntax(code))
+                    continue
+
+            if is_error:
+                renderables.append(console.render_str(f"[red]{text}[/red]"))
+            else:
+                renderables.append(console.render_str(text))
 
         elif item_type == "image":
             mime_type = item.get("mime_type", "image/png")
-            console.print(f"[dim][Image: {mime_type}][/dim]")
+            renderables.append(console.render_str(f"[dim][Image: {mime_type}][/dim]"))
 
         else:
-            console.print(f"[dim][{item_type}][/dim]")
+            # Text, not markup: "[audio]" would otherwise be swallowed as a tag
+            renderables.append(Text(f"[{item_type}]", style="dim"))
+
+    if renderables:
+        console.print(Group(*renderables))
+
+
+def print_json(data: Any) -> None:
+    """Print data as highlighted JSON.
+
+    Equivalent to console.print_json(data=...), but serializes once with the
+    _json backend; Rich would round-trip the data through the stdlib json module.
+    """
+    text = _JSON_HIGHLIGHTER(_json.dumps(data))
+    text.no_wrap = True
+    text.overflow = None
+    console.print(text, soft_wrap=True)
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    console.print(f"[bold red]Error:[/bold red] {message}")
+    console.print(_ERROR_LABEL, message)
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[bold green]Success:[/bold green] {message}")
+    console.print(_SUCCESS_LABEL, message)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
 import webbrowser
 from functools import partial
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 # Path to the UI HTML file
@@ -12,14 +13,26 @@ UI_DIR = Path(__file__).parent
 UI_HTML_PATH = UI_DIR / "index.html"
 
 
-class UIHandler(SimpleHTTPRequestHandler):
-    """HTTP handler that serves the Anvil UI with injected default server."""
+def render_ui(default_server: str) -> bytes:
+    """Render the UI HTML with the default server URL injected.
+
+    Args:
+        default_server: Default MCP server URL to inject into the UI
+
+    Returns:
+        The UTF-8 encoded page
+    """
+    html = UI_HTML_PATH.read_text()
+    return html.replace("{{DEFAULT_SERVER}}", default_server).encode("utf-8")
 
-    default_server: str = "http://localhost:8000/mcp"
 
-    def __init__(self, *args, default_server: str = "http://localhost:8000/mcp", **kwargs) -> None:
-        """Initialize handler with default server URL."""
-        UIHandler.default_server = default_server
+class UIHandler(SimpleHTTPRequestHandler):
+    """HTTP handler that serves the pre-rendered Anvil UI."""
+
+    def __init__(self, *args, prerendered_html: bytes, etag: str, **kwargs) -> None:
+        """Initialize handler with the rendered page and its ETag."""
+        self.prerendered_html = prerendered_html
+        self.etag = etag
         super().__init__(*args, directory=str(UI_DIR), **kwargs)
 
     def do_GET(self) -> None:
@@ -30,25 +43,54 @@ class UIHandler(SimpleHTTPRequestHandler):
             super().do_GET()
 
     def _serve_ui(self) -> None:
-        """Serve the UI HTML with injected default server URL."""
-        try:
-            html = UI_HTML_PATH.read_text()
-            # Inject the default server URL
-            html = html.replace("{{DEFAULT_SERVER}}", self.default_server)
-
-            self.send_response(200)
-            self.send_header("Content-type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(html.encode())))
+        """Serve the UI HTML, or 304 if the browser's copy is current."""
+        if self._etag_matches(self.headers.get("If-None-Match")):
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
             self.end_headers()
-            self.wfile.write(html.encode())
-        except FileNotFoundError:
-            self.send_error(404, "UI file not found")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.prerendered_html)))
+        self.send_header("ETag", self.etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(self.prerendered_html)
+
+    def _etag_matches(self, if_none_match: str | None) -> bool:
+        """Check an If-None-Match header value against the page's ETag."""
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or self.etag in tags
 
     def log_message(self, format: str, *args) -> None:
         """Suppress default logging."""
         _ = format, args  # Unused
 
 
+def create_ui_server(
+    host: str = "127.0.0.1",
+    port: int = 5000,
+    default_server: str = "http://localhost:8000/mcp",
+) -> ThreadingHTTPServer:
+    """Create the UI server with the page rendered up front.
+
+    Args:
+        host: Host to bind to
+        port: Port to listen on
+        default_server: Default MCP server URL to inject into the UI
+
+    Returns:
+        A bound server, ready for serve_forever()
+    """
+    html = render_ui(default_server)
+    etag = f'"{hashlib.sha256(html).hexdigest()[:16]}"'
+    handler = partial(UIHandler, prerendered_html=html, etag=etag)
+    return ThreadingHTTPServer((host, port), handler)
+
+
 def run_ui_server(
     host: str = "127.0.0.1",
     port: int = 5000,
@@ -61,9 +103,7 @@ def run_ui_server(
         port: Port to listen on
         default_server: Default MCP server URL to inject into the UI
     """
-    handler = partial(UIHandler, default_server=default_server)
-
-    server = HTTPServer((host, port), handler)
+    server = create_ui_server(host=host, port=port, default_server=default_server)
 
     url = f"http://{host}:{port}"
     print(f"Starting Anvil UI at {url}")
@@ -1,9 +1,124 @@
 """Pytest configuration and fixtures for Anvil tests."""
 
+import threading
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import AsyncMock
+
 import pytest
 
+from forge_anvil.client import AnvilClient
+
+MOCK_SERVER_URL = "http://localhost:8000/mcp"
+
 
 @pytest.fixture
 def mock_server_url() -> str:
     """Default mock server URL for testing."""
-    return "http://localhost:8000/mcp"
+    return MOCK_SERVER_URL
+
+
+@pytest.fixture
+def bad_url() -> str:
+    """URL of a server that is not there (nothing listens on port 1)."""
+    return "http://127.0.0.1:1/mcp"
+
+
+@pytest.fixture(scope="session")
+def default_client() -> AnvilClient:
+    """Client with default settings, shared by tests that only read attributes."""
+    return AnvilClient(MOCK_SERVER_URL)
+
+
+@pytest.fixture(scope="session")
+def custom_timeout_client() -> AnvilClient:
+    """Client with a custom timeout, shared by tests that only read attributes."""
+    return AnvilClient(MOCK_SERVER_URL, timeout=60.0)
+
+
+@pytest.fixture
+def make_session() -> Callable[..., AsyncMock]:
+    """Factory for AsyncMock stand-ins of an open fastmcp.Client session.
+
+    Every session method raises side_effect when it is given; otherwise
+    list_tools returns list_tools_return.
+    """
+
+    def factory(
+        list_tools_return: list[Any] | None = None,
+        side_effect: BaseException | None = None,
+    ) -> AsyncMock:
+        session = AsyncMock()
+        session.list_tools.return_value = list_tools_return or []
+        if side_effect is not None:
+            for method in ("list_tools", "call_tool", "list_resources", "list_prompts", "ping"):
+                getattr(session, method).side_effect = side_effect
+        return session
+
+    return factory
+
+
+@pytest.fixture
+def mock_anvil_client(make_session: Callable[..., AsyncMock]) -> AnvilClient:
+    """Client whose session is an AsyncMock; reconfigure it via client._client."""
+    client = AnvilClient("http://test/mcp")
+    client._client = make_session()
+    return client
+
+
+class UnavailableHandler(BaseHTTPRequestHandler):
+    """Answer every request with 503 Service Unavailable."""
+
+    def _unavailable(self) -> None:
+        # Drain the body so the client sees the response, not a reset connection
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_POST = do_DELETE = _unavailable
+
+    def log_message(self, format: str, *args) -> None:
+        """Suppress default logging."""
+        _ = format, args  # Unused
+
+
+class UnresponsiveHandler(BaseHTTPRequestHandler):
+    """Accept every request and never answer until the server shuts down."""
+
+    released = threading.Event()
+
+    def _hang(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.released.wait()
+
+    do_GET = do_POST = do_DELETE = _hang
+
+    def log_message(self, format: str, *args) -> None:
+        """Suppress default logging."""
+        _ = format, args  # Unused
+
+
+def _serve(handler: type[BaseHTTPRequestHandler]) -> Iterator[str]:
+    """Serve handler on an ephemeral loopback port and yield its MCP URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}/mcp"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="session")
+def unavailable_server_url() -> Iterator[str]:
+    """URL of a local server that responds 503 to everything, started once per session."""
+    yield from _serve(UnavailableHandler)
+
+
+@pytest.fixture(scope="session")
+def unresponsive_server_url() -> Iterator[str]:
+    """URL of a local server that never responds, started once per session."""
+    yield from _serve(UnresponsiveHandler)
+    UnresponsiveHandler.released.set()
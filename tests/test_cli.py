@@ -1,8 +1,13 @@
 """Tests for Anvil CLI."""
 
+import subprocess
+import sys
+
+import pytest
+import typer
 from typer.testing import CliRunner
 
-from forge_anvil.cli import app
+from forge_anvil.cli import _parse_header_items, app, parse_arg_values, parse_headers
 
 runner = CliRunner()
 
@@ -59,8 +64,94 @@ class TestCLIHelp:
         assert "Launch interactive web UI" in result.output
 
 
+class TestCLIStartup:
+    """Tests for CLI import cost."""
+
+    def test_cli_import_does_not_load_fastmcp(self) -> None:
+        """Test that fastmcp is only imported once a command talks to a server."""
+        code = "import sys, forge_anvil.cli; print('fastmcp' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+
+class TestParseHeaders:
+    """Tests for header parsing."""
+
+    def test_no_headers(self) -> None:
+        """Test that missing headers parse to an empty dict."""
+        assert parse_headers(None) == {}
+        assert parse_headers([]) == {}
+
+    def test_headers(self) -> None:
+        """Test that headers are split on the first ': '."""
+        headers = parse_headers(["x-api-key: secret", "Authorization: Bearer a: b"])
+        assert headers == {"x-api-key": "secret", "Authorization": "Bearer a: b"}
+
+    def test_headers_cached(self) -> None:
+        """Test that repeated headers hit the cache but return independent dicts."""
+        _parse_header_items.cache_clear()
+        first = parse_headers(["x-api-key: secret"])
+        first["x-extra"] = "mutated"
+        second = parse_headers(["x-api-key: secret"])
+        assert second == {"x-api-key": "secret"}
+        assert _parse_header_items.cache_info().hits == 1
+
+    def test_invalid_header(self) -> None:
+        """Test that headers without ': ' are rejected."""
+        with pytest.raises(typer.BadParameter):
+            parse_headers(["x-api-key=secret"])
+
+
+class TestParseArgValues:
+    """Tests for parsing --arg values."""
+
+    @pytest.mark.parametrize(
+        ("values", "expected"),
+        [
+            (["1", "true", '"x"', "null"], [1, True, "x", None]),
+            (["Berlin", "3"], ["Berlin", 3]),
+            (["[1, 2]", "metric"], [[1, 2], "metric"]),
+            (['{"a": 1}'], [{"a": 1}]),
+            (["1,[2", "3]"], ["1,[2", "3]"]),
+            (["[1", "2]"], ["[1", "2]"]),
+            ([""], [""]),
+            (["", "1"], ["", 1]),
+            (["New York", "2024-01-01"], ["New York", "2024-01-01"]),
+            (["12345678901234567890123", "1"], [12345678901234567890123, 1]),
+        ],
+    )
+    def test_parse_arg_values(self, values: list[str], expected: list[object]) -> None:
+        """Test that values parse exactly as they would one at a time."""
+        assert parse_arg_values(values) == expected
+
+
+class TestCLIArguments:
+    """Tests for tool argument validation."""
+
+    def test_call_invalid_arg_format(self) -> None:
+        """Test that --arg values without '=' are rejected."""
+        result = runner.invoke(app, ["call", "echo", "--arg", "city"])
+        assert result.exit_code == 1
+        assert "Invalid argument format" in result.output
+
+    def test_invalid_header_is_usage_error(self) -> None:
+        """Test that a malformed --header is reported as a usage error."""
+        result = runner.invoke(app, ["list-tools", "--header", "x-api-key=secret"])
+        assert result.exit_code == 2
+        assert "Invalid header format" in result.output
+
+    def test_call_invalid_json_args(self) -> None:
+        """Test that malformed --json-args is rejected."""
+        result = runner.invoke(app, ["call", "echo", "--json-args", "{not json"])
+        assert result.exit_code == 1
+        assert "Invalid JSON" in result.output
+
+
+@pytest.mark.remote
 class TestCLIConnectionErrors:
-    """Tests for CLI connection error handling."""
+    """Tests for CLI connection error handling (resolve an unknown host)."""
 
     def test_info_connection_error(self) -> None:
         """Test info command handles connection errors."""
@@ -79,3 +170,17 @@ class TestCLIConnectionErrors:
         result = runner.invoke(app, ["ping", "--server", "http://invalid:9999/mcp"])
         assert result.exit_code == 1
         assert "not responding" in result.output
+
+
+class TestCLIServerErrors:
+    """Tests for CLI error handling against a local server that answers 503."""
+
+    @pytest.mark.parametrize(
+        ("command", "message"),
+        [("info", "Error"), ("list-tools", "Error"), ("ping", "not responding")],
+    )
+    def test_server_error(self, unavailable_server_url: str, command: str, message: str) -> None:
+        """Test commands exit with an error when the server is unavailable."""
+        result = runner.invoke(app, [command, "--server", unavailable_server_url])
+        assert result.exit_code == 1
+        assert message in result.output
@@ -1,24 +1,56 @@
 """Tests for AnvilClient."""
 
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+# AnvilClient imports fastmcp lazily; importing it here keeps that multi-second
+# import out of the tests that run under @pytest.mark.timeout
+import fastmcp.client.transports  # noqa: F401
+import httpx
 import pytest
+import respx
+from mcp.types import (
+    AudioContent,
+    ImageContent,
+    Implementation,
+    InitializeResult,
+    LoggingCapability,
+    ServerCapabilities,
+    TextContent,
+    ToolsCapability,
+)
 
-from forge_anvil.client import AnvilClient, AnvilError, ConnectionError, ToolCallError
+from forge_anvil.client import (
+    AnvilClient,
+    AnvilError,
+    ConnectionError,
+    ToolCallError,
+    _content_to_list,
+)
 
 
 class TestAnvilClientInit:
     """Tests for AnvilClient initialization."""
 
-    def test_init_with_url(self) -> None:
+    def test_init_with_url(self, default_client: AnvilClient) -> None:
         """Test client initialization with URL."""
-        client = AnvilClient("http://localhost:8000/mcp")
-        assert client.server_url == "http://localhost:8000/mcp"
-        assert client.timeout == 30.0
-        assert client.headers == {}
+        assert default_client.server_url == "http://localhost:8000/mcp"
+        assert default_client.timeout is None
+        assert default_client.headers == {}
 
-    def test_init_with_custom_timeout(self) -> None:
+    def test_init_with_custom_timeout(self, custom_timeout_client: AnvilClient) -> None:
         """Test client initialization with custom timeout."""
-        client = AnvilClient("http://localhost:8000/mcp", timeout=60.0)
-        assert client.timeout == 60.0
+        assert custom_timeout_client.timeout == 60.0
+
+    def test_fresh_client_matches_shared(
+        self, mock_server_url: str, default_client: AnvilClient
+    ) -> None:
+        """Test a fresh client matches the shared one, so no test has mutated it."""
+        client = AnvilClient(mock_server_url)
+        assert vars(client) == vars(default_client)
 
     def test_init_with_headers(self) -> None:
         """Test client initialization with custom headers."""
@@ -42,35 +74,244 @@ class TestAnvilClientInit:
 class TestAnvilErrors:
     """Tests for Anvil error classes."""
 
-    def test_anvil_error_is_base(self) -> None:
+    @pytest.mark.parametrize("exc", [ConnectionError, ToolCallError])
+    def test_anvil_error_is_base(self, exc: type[AnvilError]) -> None:
         """Test that AnvilError is the base exception."""
-        assert issubclass(ConnectionError, AnvilError)
-        assert issubclass(ToolCallError, AnvilError)
-
-    def test_connection_error_message(self) -> None:
-        """Test ConnectionError message."""
-        error = ConnectionError("Failed to connect")
-        assert str(error) == "Failed to connect"
+        assert issubclass(exc, AnvilError)
 
-    def test_tool_call_error_message(self) -> None:
-        """Test ToolCallError message."""
-        error = ToolCallError("Tool not found")
-        assert str(error) == "Tool not found"
+    @pytest.mark.parametrize(
+        ("exc", "message"),
+        [(ConnectionError, "Failed to connect"), (ToolCallError, "Tool not found")],
+    )
+    def test_error_message(self, exc: type[AnvilError], message: str) -> None:
+        """Test that errors keep their message."""
+        assert str(exc(message)) == message
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestAnvilClientConnectionError:
     """Tests for connection errors."""
 
-    @pytest.mark.asyncio
-    async def test_list_tools_connection_error(self) -> None:
+    @pytest.fixture(autouse=True)
+    def _refuse_connections(self, respx_mock: respx.MockRouter) -> None:
+        """Fail every HTTP request at the transport, without touching the network."""
+        respx_mock.route().mock(side_effect=httpx.ConnectError("Connection refused"))
+
+    @pytest.mark.timeout(2, method="thread")
+    async def test_list_tools_connection_error(self, bad_url: str) -> None:
         """Test that list_tools raises ConnectionError on failure."""
-        client = AnvilClient("http://invalid-server:9999/mcp")
+        client = AnvilClient(bad_url, timeout=0.1)
         with pytest.raises(ConnectionError):
             await client.list_tools()
 
-    @pytest.mark.asyncio
-    async def test_ping_returns_false_on_connection_error(self) -> None:
+    @pytest.mark.timeout(2, method="thread")
+    async def test_ping_returns_false_on_connection_error(self, bad_url: str) -> None:
         """Test that ping returns False on connection error."""
-        client = AnvilClient("http://invalid-server:9999/mcp")
+        client = AnvilClient(bad_url, timeout=0.1)
         result = await client.ping()
         assert result is False
+
+    @pytest.mark.timeout(2, method="thread")
+    async def test_context_connection_error(self, bad_url: str) -> None:
+        """Test that failing to open the session raises ConnectionError."""
+        with pytest.raises(ConnectionError):
+            async with AnvilClient(bad_url, timeout=0.1):
+                pass
+
+
+class TestAnvilClientServerError:
+    """Tests against a local server that is up but misbehaves."""
+
+    @pytest.mark.timeout(5, method="thread")
+    async def test_list_tools_server_error(self, unavailable_server_url: str) -> None:
+        """Test that an HTTP 503 surfaces as ConnectionError."""
+        client = AnvilClient(unavailable_server_url, timeout=0.5)
+        with pytest.raises(ConnectionError, match="503"):
+            await client.list_tools()
+
+    @pytest.mark.timeout(5, method="thread")
+    async def test_ping_returns_false_on_server_error(self, unavailable_server_url: str) -> None:
+        """Test that ping returns False when the server answers 503."""
+        client = AnvilClient(unavailable_server_url, timeout=0.5)
+        assert await client.ping() is False
+
+    @pytest.mark.timeout(5, method="thread")
+    async def test_list_tools_times_out(self, unresponsive_server_url: str) -> None:
+        """Test that a server that never answers fails after the client timeout."""
+        client = AnvilClient(unresponsive_server_url, timeout=0.2)
+        start = time.monotonic()
+        with pytest.raises(ConnectionError, match="Timed out"):
+            await client.list_tools()
+        assert time.monotonic() - start < 2
+
+
+class FakeClient:
+    """Stand-in for fastmcp.Client that records how it is used."""
+
+    def __init__(self) -> None:
+        self.entered = 0
+        self.exited = 0
+        self.initialize_result = InitializeResult(
+            protocolVersion="2025-06-18",
+            capabilities=ServerCapabilities(
+                tools=ToolsCapability(listChanged=False),
+                logging=LoggingCapability(),
+            ),
+            serverInfo=Implementation(name="fake", version="1.2.3"),
+            instructions="Be nice",
+        )
+
+    async def __aenter__(self) -> "FakeClient":
+        self.entered += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.exited += 1
+
+    async def list_tools(self) -> list[Any]:
+        return [SimpleNamespace(name="echo", description="Echo input", inputSchema={})]
+
+    async def ping(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def fake_clients(monkeypatch: pytest.MonkeyPatch) -> list[FakeClient]:
+    """Make AnvilClient create FakeClients and collect them."""
+    created: list[FakeClient] = []
+
+    def create_client(_self: AnvilClient) -> FakeClient:
+        created.append(FakeClient())
+        return created[-1]
+
+    monkeypatch.setattr(AnvilClient, "_create_client", create_client)
+    return created
+
+
+class TestAnvilClientSession:
+    """Tests for reusing one session via the async context manager."""
+
+    async def test_context_reuses_one_connection(self, fake_clients: list[FakeClient]) -> None:
+        """Test that calls inside the context share a single connection."""
+        async with AnvilClient("http://localhost:8000/mcp") as client:
+            tools = await client.list_tools()
+            assert await client.ping() is True
+
+        assert tools == [{"name": "echo", "description": "Echo input", "input_schema": {}}]
+        assert len(fake_clients) == 1
+        assert fake_clients[0].entered == 1
+        assert fake_clients[0].exited == 1
+        assert client._client is None
+
+    async def test_calls_outside_context_connect_each_time(
+        self, fake_clients: list[FakeClient]
+    ) -> None:
+        """Test that without the context every call opens its own connection."""
+        client = AnvilClient("http://localhost:8000/mcp")
+        await client.list_tools()
+        await client.ping()
+
+        assert len(fake_clients) == 2
+        assert all(c.entered == c.exited == 1 for c in fake_clients)
+
+    async def test_get_server_info(self, fake_clients: list[FakeClient]) -> None:
+        """Test that server info is read from the initialize result."""
+        info = await AnvilClient("http://localhost:8000/mcp").get_server_info()
+        assert len(fake_clients) == 1
+        assert info == {
+            "name": "fake",
+            "version": "1.2.3",
+            "protocol_version": "2025-06-18",
+            "capabilities": {"tools": True, "logging": True},
+            "instructions": "Be nice",
+        }
+
+    async def test_iter_tools_yields_dicts(self, fake_clients: list[FakeClient]) -> None:
+        """Test that iter_tools yields plain dicts after releasing the connection."""
+        client = AnvilClient("http://localhost:8000/mcp")
+        async for tool in client.iter_tools():
+            assert tool == {"name": "echo", "description": "Echo input", "input_schema": {}}
+            assert fake_clients[0].exited == 1
+            break
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestAnvilClientMockSession:
+    """Tests for AnvilClient with an AsyncMock session injected."""
+
+    async def test_list_tools(
+        self, mock_anvil_client: AnvilClient, make_session: Callable[..., AsyncMock]
+    ) -> None:
+        """Test tools from the session are converted to dicts."""
+        tool = SimpleNamespace(name="echo", description=None, inputSchema={"type": "object"})
+        mock_anvil_client._client = make_session(list_tools_return=[tool])
+        assert await mock_anvil_client.list_tools() == [
+            {"name": "echo", "description": None, "input_schema": {"type": "object"}}
+        ]
+
+    async def test_list_tools_error_is_translated(
+        self, mock_anvil_client: AnvilClient, make_session: Callable[..., AsyncMock]
+    ) -> None:
+        """Test session errors surface as ConnectionError."""
+        mock_anvil_client._client = make_session(side_effect=OSError("boom"))
+        with pytest.raises(ConnectionError, match="boom"):
+            await mock_anvil_client.list_tools()
+
+    async def test_call_tool_error_is_translated(
+        self, mock_anvil_client: AnvilClient, make_session: Callable[..., AsyncMock]
+    ) -> None:
+        """Test session errors during a tool call surface as ToolCallError."""
+        mock_anvil_client._client = make_session(side_effect=OSError("boom"))
+        with pytest.raises(ToolCallError, match="echo"):
+            await mock_anvil_client.call_tool("echo")
+
+    async def test_call_tool(self, mock_anvil_client: AnvilClient) -> None:
+        """Test tool arguments are forwarded and the result converted."""
+        session = mock_anvil_client._client
+        assert isinstance(session, AsyncMock)
+        session.call_tool.return_value = SimpleNamespace(
+            content=[TextContent(type="text", text="hi")], isError=False
+        )
+        result = await mock_anvil_client.call_tool("echo", {"text": "hi"})
+        session.call_tool.assert_awaited_once_with("echo", {"text": "hi"})
+        assert result == {"content": [{"type": "text", "text": "hi"}], "is_error": False}
+
+    async def test_ping_false_on_error(
+        self, mock_anvil_client: AnvilClient, make_session: Callable[..., AsyncMock]
+    ) -> None:
+        """Test ping reports False when the session fails."""
+        mock_anvil_client._client = make_session(side_effect=OSError("boom"))
+        assert await mock_anvil_client.ping() is False
+
+
+class TestContentToList:
+    """Tests for converting tool result content."""
+
+    @pytest.mark.parametrize(
+        ("item", "expected"),
+        [
+            (TextContent(type="text", text="hi"), {"type": "text", "text": "hi"}),
+            (
+                ImageContent(type="image", data="aGk=", mimeType="image/jpeg"),
+                {"type": "image", "data": "aGk=", "mime_type": "image/jpeg"},
+            ),
+            (
+                AudioContent(type="audio", data="aGk=", mimeType="audio/wav"),
+                {"type": "image", "data": "aGk=", "mime_type": "audio/wav"},
+            ),
+            ("plain", {"type": "text", "text": "plain"}),
+            ({"type": "custom"}, {"type": "custom"}),
+            (42, {"type": "text", "text": "42"}),
+        ],
+    )
+    def test_item_conversion(self, item: Any, expected: dict[str, Any]) -> None:
+        """Test that each kind of content item converts to a plain dict."""
+        assert _content_to_list(SimpleNamespace(content=[item])) == [expected]
+
+    def test_bare_list_and_scalar(self) -> None:
+        """Test results that are a list of items or a single item."""
+        assert _content_to_list(["a", "b"]) == [
+            {"type": "text", "text": "a"},
+            {"type": "text", "text": "b"},
+        ]
+        assert _content_to_list("a") == [{"type": "text", "text": "a"}]
@@ -0,0 +1,102 @@
+"""Tests for the JSON helpers."""
+
+import json
+
+import pytest
+
+from forge_anvil import _json
+
+
+@pytest.fixture(params=["simdjson", "orjson", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run each test against every backend that is installed."""
+    if request.param == "simdjson":
+        pytest.importorskip("simdjson")
+        monkeypatch.setattr(_json, "SIMDJSON_MIN_SIZE", 0)
+    else:
+        monkeypatch.setattr(_json, "_simdjson_parser", None)
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        # simdjson is only used when orjson is missing
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+class TestJSONHelpers:
+    """Tests for loads/dumps across backends."""
+
+    @pytest.mark.usefixtures("backend")
+    def test_round_trip(self) -> None:
+        """Test that dumps output parses back to the same object."""
+        data = {"city": "Berlin", "days": [1, 2, 3], "ok": True, "extra": None}
+        assert _json.loads(_json.dumps(data)) == data
+
+    @pytest.mark.usefixtures("backend")
+    @pytest.mark.parametrize("text", ["[1, 2]", "42", '"text"', "null"])
+    def test_loads_non_object_documents(self, text: str) -> None:
+        """Test that top-level arrays and scalars decode to plain Python values."""
+        assert _json.loads(text) == json.loads(text)
+
+    @pytest.mark.usefixtures("backend")
+    def test_loads_exact_big_int(self) -> None:
+        """Test that integers wider than 64 bits still parse exactly."""
+        [value] = _json.loads_exact(f"[{2**70 + 1}]")
+        assert type(value) is int
+        assert value == 2**70 + 1
+
+    @pytest.mark.usefixtures("backend")
+    @pytest.mark.parametrize("value", [12345678901234567890123, -(2**63) - 1, 2**64 + 1])
+    def test_loads_keeps_ints_outside_64_bits_exact(self, value: int) -> None:
+        """Test that integers orjson would round to floats come back exact."""
+        assert _json.loads_exact(f'{{"id": {value}}}') == {"id": value}
+        assert type(_json.loads_exact(str(value))) is int
+
+    @pytest.mark.usefixtures("backend")
+    @pytest.mark.parametrize("text", ["1e400", "[18446744073709551616]", "[-1e400]"])
+    def test_loads_documents_fast_backends_reject(self, text: str) -> None:
+        """Test valid documents orjson or simdjson refuse still parse."""
+        assert _json.loads(text) == json.loads(text)
+
+    @pytest.mark.usefixtures("backend")
+    def test_loads_does_not_prescan(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that only loads_exact pays for the long-digit scan."""
+        monkeypatch.setattr(_json, "_LONG_DIGIT_RUN", None)
+        assert _json.loads('{"id": 1}') == {"id": 1}
+
+    @pytest.mark.usefixtures("backend")
+    def test_dumps_indents_two_spaces(self) -> None:
+        """Test that dumps pretty-prints with two-space indentation."""
+        assert _json.dumps({"a": 1}) == '{\n  "a": 1\n}'
+
+    @pytest.mark.usefixtures("backend")
+    def test_dumps_keeps_non_ascii(self) -> None:
+        """Test that non-ASCII text is emitted as-is rather than escaped."""
+        assert "München" in _json.dumps({"city": "München"})
+
+    @pytest.mark.usefixtures("backend")
+    def test_loads_invalid_raises_value_error(self) -> None:
+        """Test that invalid JSON raises ValueError on every backend."""
+        with pytest.raises(ValueError):
+            _json.loads("not json")
+
+    @pytest.mark.usefixtures("backend")
+    def test_dumps_big_int(self) -> None:
+        """Test that integers wider than 64 bits still serialize."""
+        assert _json.dumps(2**70) == str(2**70)
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ('{"a": 1}', True),
+            ("  [1]", True),
+            ("-1.5", True),
+            ("null", True),
+            ("Sunny, 21C", False),
+            ("", False),
+            ("   ", False),
+        ],
+    )
+    def test_looks_like_json(self, text: str, expected: bool) -> None:
+        """Test the first-character JSON prefilter."""
+        assert _json.looks_like_json(text) is expected
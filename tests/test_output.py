@@ -0,0 +1,182 @@
+"""Tests for Rich output helpers."""
+
+import pytest
+from rich.console import Console
+
+from forge_anvil import output
+
+
+@pytest.fixture
+def recorded(monkeypatch: pytest.MonkeyPatch) -> Console:
+    """Swap the output console for one that records plain text."""
+    console = Console(record=True, width=120, color_system=None)
+    monkeypatch.setattr(output, "console", console)
+    return console
+
+
+class TestPrintTables:
+    """Tests for the listing tables."""
+
+    def test_print_tools(self, recorded: Console) -> None:
+        """Test tools table lists names and a placeholder for missing descriptions."""
+        output.print_tools(
+            [
+                {"name": "get_weather", "description": "Current weather"},
+                {"name": "ping", "description": None},
+            ]
+        )
+        text = recorded.export_text()
+        assert "Available Tools" in text
+        assert "get_weather" in text
+        assert "Current weather" in text
+        assert "No description" in text
+        assert "Total: 2 tool(s)" in text
+
+    def test_print_tools_empty(self, recorded: Console) -> None:
+        """Test empty tool list message."""
+        output.print_tools([])
+        assert "No tools available" in recorded.export_text()
+
+    def test_print_resources(self, recorded: Console) -> None:
+        """Test resources table shows a dash for missing MIME types."""
+        output.print_resources(
+            [{"name": "config", "uri": "file:///config.json", "mime_type": None}]
+        )
+        text = recorded.export_text()
+        assert "file:///config.json" in text
+        assert " - " in text
+        assert "Total: 1 resource(s)" in text
+
+    def test_print_prompts(self, recorded: Console) -> None:
+        """Test prompts table marks required arguments."""
+        output.print_prompts(
+            [
+                {
+                    "name": "summarize",
+                    "description": "Summarize text",
+                    "arguments": [{"name": "text", "required": True}],
+                }
+            ]
+        )
+        text = recorded.export_text()
+        assert "summarize" in text
+        assert "text*" in text
+
+    def test_placeholders_shared_across_rows(self, recorded: Console) -> None:
+        """Test every row without a description gets the placeholder."""
+        output.print_tools([{"name": "a"}, {"name": "b"}, {"name": "c", "description": ""}])
+        assert recorded.export_text().count("No description") == 3
+
+    def test_prompt_argument_names_are_literal(self, recorded: Console) -> None:
+        """Test argument names are not interpreted as Rich markup."""
+        output.print_prompts([{"name": "p", "arguments": [{"name": "[items]"}, {"name": "n"}]}])
+        text = recorded.export_text()
+        assert "[items], n" in text
+        assert "None" not in text
+
+
+class TestPrintResult:
+    """Tests for tool call result output."""
+
+    def test_json_text_is_pretty_printed(self, recorded: Console) -> None:
+        """Test that JSON text content is re-indented."""
+        output.print_result({"content": [{"type": "text", "text": '{"city": "Berlin"}'}]})
+        assert '"city": "Berlin"' in recorded.export_text()
+
+    def test_formatted_json_text_is_not_reserialized(
+        self, recorded: Console, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test multi-line JSON is highlighted as sent, keeping its formatting."""
+
+        def fail_dumps(_data: object) -> str:
+            raise AssertionError("formatted JSON should not be re-serialized")
+
+        monkeypatch.setattr(output._json, "dumps", fail_dumps)
+        output.print_result({"content": [{"type": "text", "text": '{\n    "a": 1\n}\n'}]})
+        assert '    "a": 1' in recorded.export_text()
+
+    def test_plain_text(self, recorded: Console) -> None:
+        """Test that plain text content is printed as-is."""
+        output.print_result({"content": [{"type": "text", "text": "Sunny, 21C"}]})
+        assert "Sunny, 21C" in recorded.export_text()
+
+    def test_json_scalar_text(self, recorded: Console) -> None:
+        """Test that whitespace-padded JSON scalars are still recognized."""
+        output.print_result({"content": [{"type": "text", "text": "  true\n"}]})
+        assert recorded.export_text().strip() == "true"
+
+    def test_plain_text_skips_json_parse(
+        self, recorded: Console, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that text which cannot start a JSON value is never parsed."""
+        calls: list[str] = []
+        monkeypatch.setattr(output._json, "loads", calls.append)
+        output.print_result({"content": [{"type": "text", "text": "Sunny, 21C"}]})
+        assert calls == []
+        assert "Sunny, 21C" in recorded.export_text()
+
+    def test_error_result(self, recorded: Console) -> None:
+        """Test that error results are labelled."""
+        output.print_result({"is_error": True, "content": [{"type": "text", "text": "boom"}]})
+        text = recorded.export_text()
+        assert "Error:" in text
+        assert "boom" in text
+
+    def test_image_placeholder(self, recorded: Console) -> None:
+        """Test that image content is summarized by MIME type."""
+        output.print_result({"content": [{"type": "image", "data": "", "mime_type": "image/png"}]})
+        assert "[Image: image/png]" in recorded.export_text()
+
+    def test_unknown_content_placeholder(self, recorded: Console) -> None:
+        """Test that other content types are labelled with their type."""
+        output.print_result({"content": [{"type": "audio"}]})
+        assert "[audio]" in recorded.export_text()
+
+    def test_items_printed_in_order(self, recorded: Console) -> None:
+        """Test that all items are printed, in order, after the error label."""
+        output.print_result(
+            {
+                "is_error": True,
+                "content": [
+                    {"type": "text", "text": "first"},
+                    {"type": "text", "text": "[1, 2]"},
+                    {"type": "text", "text": "last"},
+                ],
+            }
+        )
+        lines = [line.strip() for line in recorded.export_text().splitlines() if line.strip()]
+        assert lines[0] == "Error:"
+        assert lines[1] == "first"
+        assert lines[-1] == "last"
+
+
+class TestPrintMessages:
+    """Tests for error/success messages."""
+
+    def test_print_error(self, recorded: Console) -> None:
+        """Test error message formatting."""
+        output.print_error("Something failed")
+        assert recorded.export_text().strip() == "Error: Something failed"
+
+    def test_print_tool_detail(self, recorded: Console) -> None:
+        """Test tool detail shows the input schema as JSON."""
+        output.print_tool_detail(
+            {"name": "get_weather", "input_schema": {"type": "object", "required": ["city"]}}
+        )
+        text = recorded.export_text()
+        assert "get_weather" in text
+        assert '"required": [' in text
+
+
+class TestPrintJSON:
+    """Tests for JSON-mode output."""
+
+    def test_matches_rich_print_json(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that output matches console.print_json, colours included."""
+        data = {"name": "get_weather", "tags": ["a", "b"], "count": 2, "ok": True, "x": None}
+        reference = Console(record=True, width=40, force_terminal=True, color_system="truecolor")
+        reference.print_json(data=data)
+        console = Console(record=True, width=40, force_terminal=True, color_system="truecolor")
+        monkeypatch.setattr(output, "console", console)
+        output.print_json(data)
+        assert console.export_text(styles=True) == reference.export_text(styles=True)
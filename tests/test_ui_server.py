@@ -0,0 +1,74 @@
+"""Tests for the web UI server."""
+
+import socket
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+
+import pytest
+
+from forge_anvil.ui.server import create_ui_server
+
+
+@pytest.fixture(scope="module")
+def ui_url() -> Iterator[str]:
+    """Serve the UI on an ephemeral port for the duration of the module."""
+    server = create_ui_server(port=0, default_server="http://example.test/mcp")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+
+
+def fetch(url: str, headers: dict[str, str] | None = None) -> tuple[int, dict[str, str], bytes]:
+    """GET a URL and return status, headers and body (without raising on 304)."""
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, dict(response.headers), response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+class TestUIServer:
+    """Tests for serving the UI page."""
+
+    def test_serves_page_with_default_server(self, ui_url: str) -> None:
+        """Test that the page is served with the default server injected."""
+        status, headers, body = fetch(f"{ui_url}/")
+        assert status == 200
+        assert b"http://example.test/mcp" in body
+        assert b"{{DEFAULT_SERVER}}" not in body
+        assert int(headers["Content-Length"]) == len(body)
+        assert headers["ETag"]
+
+    def test_index_html_path(self, ui_url: str) -> None:
+        """Test that /index.html serves the same rendered page."""
+        _, _, root = fetch(f"{ui_url}/")
+        status, _, body = fetch(f"{ui_url}/index.html")
+        assert status == 200
+        assert body == root
+
+    def test_not_modified(self, ui_url: str) -> None:
+        """Test that a matching If-None-Match gets 304 with no body."""
+        _, headers, _ = fetch(f"{ui_url}/")
+        status, _, body = fetch(f"{ui_url}/", {"If-None-Match": headers["ETag"]})
+        assert status == 304
+        assert body == b""
+
+    def test_stale_etag(self, ui_url: str) -> None:
+        """Test that a different ETag gets the full page."""
+        status, _, body = fetch(f"{ui_url}/", {"If-None-Match": '"stale"'})
+        assert status == 200
+        assert body
+
+    def test_slow_client_does_not_block_others(self, ui_url: str) -> None:
+        """Test that an idle connection does not stall other requests."""
+        host, port = ui_url.removeprefix("http://").split(":")
+        with socket.create_connection((host, int(port)), timeout=5):
+            # Connected but never sends a request line
+            status, _, _ = fetch(f"{ui_url}/")
+        assert status == 200